@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-from collections import UserDict
 from os import PathLike
 from pathlib import Path
 from typing import (
@@ -68,6 +67,12 @@ class DataStream(abc.ABC, Generic[TData]):
     def _parser(self, *args, **kwargs) -> TData:
         pass
 
+    @staticmethod
+    def _read_all_bytes(path: PathLike) -> bytes:
+        """Reads the whole file in a single unbuffered read. Prefer this when the whole file is consumed."""
+        with open(path, "rb", buffering=0) as f:
+            return f.readall()
+
     @property
     def data(self) -> TData:
         """Returns the data"""
@@ -89,17 +94,21 @@ class DataStream(abc.ABC, Generic[TData]):
         return self._parser(self._file_reader(path))
 
     def _load(self, /, path: Optional[PathLike] = None, *, force_reload: bool = False, **kwargs) -> TData:
-        if force_reload is False and self._data:
+        if force_reload is False and self._data is not None:
             pass
         else:
             path = Path(path) if path is not None else self.path
             if path:
                 self._path = path
-                self._data = self._parser(self._file_reader(path))
+                self._data = self._read_and_parse(path, force_reload=force_reload)
             else:
                 raise ValueError("Path attribute is not defined. Cannot load data.")
         return self._data
 
+    def _read_and_parse(self, path: Path, *, force_reload: bool = False) -> TData:
+        """Reads and parses the file at `path`. Subclasses can override this to cache the parsed data."""
+        return self._parser(self._file_reader(path))
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__} stream with data{'' if self._data is not None else 'not'} loaded."
 
@@ -109,7 +118,7 @@ class DataStreamCollectionFactory(abc.ABC):
     def build(self) -> DataStreamCollection: ...
 
 
-class DataStreamCollection(UserDict[str, DataStream]):
+class DataStreamCollection(dict[str, DataStream]):
     """Represents a collection of data streams."""
 
     def __str__(self):
@@ -132,6 +141,24 @@ class DataStreamCollection(UserDict[str, DataStream]):
 
         return table_str
 
+    # dict returns plain dicts from these, keep the collection type as UserDict did
+    def copy(self) -> Self:
+        return type(self)(self)
+
+    def __or__(self, other: Any) -> Self:
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other: Any) -> Self:
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = type(self)(other)
+        new.update(self)
+        return new
+
     def try_append(self, key: str, value: DataStream) -> Self:
         """
         Tries to append a key-value pair to the dictionary.
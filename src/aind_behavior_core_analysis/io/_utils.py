@@ -1,3 +1,48 @@
-from typing import List, Union
+import fnmatch
+import os
+import re
+from functools import cache
+from typing import List, Tuple, Union
 
 StrPattern = Union[str, List[str]]
+
+
+def normalize_pattern(pattern: StrPattern) -> Tuple[str, ...]:
+    """Returns the pattern(s) as a tuple of glob strings."""
+    if isinstance(pattern, str):
+        return (pattern,)
+    return tuple(pattern)
+
+
+def split_glob_prefix(pattern: str) -> Tuple[str, str]:
+    """Splits a glob pattern into its literal directory prefix and the remaining pattern.
+
+    Examples:
+        "sub/*.bin" -> ("sub", "*.bin"); "a/b*/c.csv" -> ("a", "b*/c.csv"); "*.csv" -> ("", "*.csv")
+    """
+    literal = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+    if literal == pattern:  # No wildcards, the parent directory is the prefix
+        return os.path.split(pattern)
+    sep_index = max(literal.rfind("/"), literal.rfind(os.sep))
+    if sep_index < 0:
+        return "", pattern
+    return pattern[:sep_index], pattern[sep_index + 1 :]
+
+
+def is_single_component(pattern: str) -> bool:
+    """Whether the glob pattern only matches names directly inside a single directory."""
+    return not ("**" in pattern or "/" in pattern or os.sep in pattern)
+
+
+@cache
+def compile_glob_pattern(pattern: str) -> re.Pattern:
+    """Compiles a single-component glob pattern into a regex that matches `os.path.normcase`'d names."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+@cache
+def compile_glob_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compiles several single-component glob patterns into one regex that matches a name if any of them does."""
+    if len(patterns) == 1:
+        return compile_glob_pattern(patterns[0])
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
 import csv
+import datetime
+import hashlib
 import io
-import json
-from functools import cache
+import os
+import pickle
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, Final, List, Literal, NewType, Optional, TextIO, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Generator,
+    List,
+    Literal,
+    NewType,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+    Union,
+)
 
 import harp
 import harp.reader
@@ -20,16 +42,61 @@ from harp.reader import (
     _create_register_parser,
     _ReaderParams,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
 from typing_extensions import override
 
 from aind_behavior_core_analysis.io._core import DataStream, DataStreamCollection, DataStreamCollectionFactory
 
-from ._utils import StrPattern
+from ._utils import StrPattern, compile_glob_patterns, is_single_component, normalize_pattern, split_glob_prefix
+
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlSafeLoader
 
 DataFrameOrSeries = Union[pd.DataFrame, pd.Series]
 
 
+@cache
+def _get_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Returns a TypeAdapter that validates a list of `model`, building its schema only once per model."""
+    return TypeAdapter(List[model])
+
+
+_SOFTWARE_EVENT_LIST_ADAPTER: Final = _get_list_adapter(SoftwareEvent)
+
+_JSON_LINES_SEPARATOR: Final = re.compile(rb"\s*\n\s*")
+
+_CSV_SNIFF_SAMPLE_SIZE: Final = 8192
+
+
+def _replace_atomically(target: Path, write: Callable[[Path], Any]) -> None:
+    """Writes `target` through a temporary file in the same directory, so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(Path(tmp))
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@cache
+def _software_event_schema_key() -> str:
+    """Identifies the `SoftwareEvent` model that parsed a cached entry, down to the version of its package."""
+    try:
+        package_version = version("aind_behavior_services")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return f"{SoftwareEvent.__module__}.{SoftwareEvent.__qualname__}@{package_version}"
+
+
 class SoftwareEventStream(DataStream[DataFrameOrSeries]):
     """Represents a generic Software event."""
 
@@ -41,49 +108,93 @@ class SoftwareEventStream(DataStream[DataFrameOrSeries]):
         name: Optional[str] = None,
         auto_load: bool = False,
         inner_parser: Optional[BaseModel] = None,
+        dedupe_inner: bool = False,
+        cache_dir: Optional[PathLike] = None,
         **kwargs,
     ) -> None:
         super().__init__(path, name=name, auto_load=False, **kwargs)
         self._inner_parser = inner_parser
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._inner_parser_adapter = (
+            _get_list_adapter(inner_parser if isinstance(inner_parser, type) else type(inner_parser))
+            if inner_parser is not None
+            else None
+        )
+        self._dedupe_inner = dedupe_inner
         self._run_auto_load(auto_load)
 
     def _load(self, /, path: Optional[PathLike] = None, *, force_reload: bool = False, **kwargs) -> DataFrameOrSeries:
+        if force_reload is False and self._data is not None:
+            return self._data  # Already loaded and parsed
         super()._load(path, force_reload=force_reload, **kwargs)
         self._data = self._apply_inner_parser(self._data)
         return self._data
 
+    def _read_and_parse(self, path: Path, *, force_reload: bool = False) -> DataFrameOrSeries:
+        """Parses the events, going through `cache_dir` if one was given.
+
+        Entries are keyed on the file's path, modification time and size, so an edited file is parsed again, and
+        on the `SoftwareEvent` model and its package version, so a schema change does not reuse stale entries.
+        `force_reload` skips reading the cache but refreshes the entry. The inner parser is never cached.
+        """
+        if self._cache_dir is None:
+            return super()._read_and_parse(path, force_reload=force_reload)
+        stat = os.stat(path)
+        key = f"{_software_event_schema_key()}:{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        cache_file = self._cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl"
+        if not force_reload and cache_file.is_file():
+            try:
+                return pd.read_pickle(cache_file)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+                pass  # Unreadable entries (e.g. truncated or from another pandas version) are a cache miss
+        data = super()._read_and_parse(path, force_reload=force_reload)
+        try:  # The cache is best-effort, a read-only cache directory should not break loading
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            _replace_atomically(cache_file, data.to_pickle)
+        except OSError:
+            pass
+        return data
+
     @classmethod
-    def _file_reader(cls, path, *args, **kwargs) -> List[str]:
-        with open(path, "r+", encoding="utf-8") as f:
-            return f.readlines()
+    def _file_reader(cls, path, *args, **kwargs) -> bytes:
+        return cls._read_all_bytes(path)
 
     @classmethod
     def _parser(
         cls,
-        value: List[str],
+        value: bytes | str | List[str],
         *args,
         validate: bool = True,
         pydantic_validate_kwargs: Optional[dict] = None,
         pydantic_model_dump_kwargs: Optional[dict] = None,
         **kwargs,
     ) -> DataFrameOrSeries:
-        if not isinstance(value, list):
-            value = [value]
+        payload = cls._as_json_array(value)
         if validate:
-            _entries = [
-                SoftwareEvent.model_validate_json(
-                    line, **(pydantic_validate_kwargs if pydantic_validate_kwargs else {})
-                ).model_dump(**(pydantic_model_dump_kwargs if pydantic_model_dump_kwargs else {}))
-                for line in value
-            ]
+            events = _SOFTWARE_EVENT_LIST_ADAPTER.validate_json(
+                payload, **(pydantic_validate_kwargs if pydantic_validate_kwargs else {})
+            )
+            if pydantic_model_dump_kwargs:
+                _entries = [event.model_dump(**pydantic_model_dump_kwargs) for event in events]
+            else:  # SoftwareEvent is flat, so its field values can be used as-is
+                _entries = [event.__dict__ for event in events]
         else:
-            _entries = [json.loads(line) for line in value]
+            _entries = from_json(payload)
 
-        df = pd.DataFrame(_entries)
-        df.set_index("timestamp", inplace=True)
+        df = pd.DataFrame.from_records(_entries, index="timestamp")
 
         return df
 
+    @staticmethod
+    def _as_json_array(value: bytes | str | List[str]) -> bytes:
+        """Joins the lines of a JSON-lines document into a single JSON array."""
+        if isinstance(value, list):
+            value = "\n".join(value)
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        # Raw newlines can not occur inside JSON values, so every line break (and any blank lines) is a separator
+        return b"[" + _JSON_LINES_SEPARATOR.sub(b",", value.strip()) + b"]"
+
     def _apply_inner_parser(self, df: pd.DataFrame) -> pd.DataFrame:
         if self._inner_parser is None:
             pass
@@ -92,7 +203,12 @@ class SoftwareEventStream(DataStream[DataFrameOrSeries]):
                 raise ValueError("Data can not be None")
             if "data" not in df.columns:
                 raise ValueError("data column not found")
-            df["data"] = df.apply(lambda x: self._inner_parser.model_validate(x["data"]), axis=1)
+            df["data"] = self._inner_parser_adapter.validate_python(df["data"].tolist())
+            if self._dedupe_inner:
+                try:
+                    df["data"] = pd.Categorical(df["data"])
+                except TypeError:
+                    pass  # Values are not hashable (e.g. unfrozen models, or list fields), keep the object column
         return df
 
 
@@ -100,29 +216,100 @@ class CsvStream(DataStream[DataFrameOrSeries]):
     """Represents a generic Software event."""
 
     def __init__(
-        self, /, path: Optional[PathLike], *, name: Optional[str] = None, auto_load: bool = False, **kwargs
+        self,
+        /,
+        path: Optional[PathLike],
+        *,
+        name: Optional[str] = None,
+        auto_load: bool = False,
+        nrows: Optional[int] = None,
+        usecols: Optional[List[str | int]] = None,
+        **kwargs,
     ) -> None:
         super().__init__(path, name=name, auto_load=False, **kwargs)
+        self._nrows = nrows
+        self._usecols = usecols
         self._run_auto_load(auto_load)
 
     @classmethod
-    def _file_reader(cls, path, *args, **kwargs) -> str:
-        with open(path, "r+", encoding="utf-8") as f:
-            return f.read()
+    def _file_reader(cls, path, *args, **kwargs) -> Path:
+        return Path(path)  # pandas reads the file itself
 
-    @classmethod
     def _parser(
-        cls,
-        value: str,
+        self,
+        value: PathLike,
         *args,
         infer_index_col: Optional[str | int] = 0,
         col_names: Optional[List[str]] = None,
         **kwargs,
     ) -> DataFrameOrSeries:
-        has_header = csv.Sniffer().has_header(value)
+        return pd.read_csv(value, **self._read_csv_kwargs(value, infer_index_col, col_names))
+
+    def iter_chunks(
+        self,
+        chunksize: int,
+        *,
+        infer_index_col: Optional[str | int] = 0,
+        col_names: Optional[List[str]] = None,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Yields the file in DataFrames of up to `chunksize` rows, without loading it into the stream.
+
+        Only one chunk is held in memory at a time. Column dtypes are inferred per chunk and may differ
+        between chunks.
+        """
+        if self.path is None:
+            raise ValueError("Path attribute is not defined. Cannot read data.")
+        read_csv_kwargs = self._read_csv_kwargs(self.path, infer_index_col, col_names)
+        with pd.read_csv(self.path, chunksize=chunksize, **read_csv_kwargs) as chunks:
+            yield from chunks
+
+    def _read_csv_kwargs(
+        self, value: PathLike, infer_index_col: Optional[str | int], col_names: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        stat = os.stat(value)
+        has_header = self._sniff_file_has_header(os.fspath(value), stat.st_mtime_ns, stat.st_size)
         _header = 0 if has_header is True else None
-        df = pd.read_csv(io.StringIO(value), header=_header, index_col=infer_index_col, names=col_names)
-        return df
+        return {
+            "header": _header,
+            "index_col": infer_index_col,
+            "names": col_names,
+            "usecols": self._usecols,
+            "nrows": self._nrows,
+            "encoding": "utf-8",
+            "engine": "c",
+            "low_memory": False,
+            "memory_map": True,
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sniff_file_has_header(path: str, mtime_ns: int, size: int) -> bool:
+        """Sniffs the start of the file. Modification time and size are part of the cache key."""
+        with open(path, "rb") as f:
+            sample = f.read(_CSV_SNIFF_SAMPLE_SIZE)
+        # If the file was cut short, only complete rows are sniffed, a truncated last row would skew the column count
+        if len(sample) == _CSV_SNIFF_SAMPLE_SIZE and (last_newline := sample.rfind(b"\n")) > 0:
+            sample = sample[: last_newline + 1]
+        return CsvStream._sniff_has_header(sample.decode("utf-8", errors="ignore"))
+
+    @staticmethod
+    def _sniff_has_header(sample: str) -> bool:
+        try:
+            return csv.Sniffer().has_header(sample)
+        except csv.Error:
+            # The dialect can not be determined for e.g. single-column files. A numeric first row is data.
+            first_row = next(csv.reader(io.StringIO(sample)), [])
+            if first_row and all(CsvStream._is_number(field) for field in first_row):
+                return False
+            raise
+
+    @staticmethod
+    def _is_number(value: str) -> bool:
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
 
 
 class SingletonStream(DataStream[str | BaseModel]):
@@ -142,7 +329,7 @@ class SingletonStream(DataStream[str | BaseModel]):
 
     @classmethod
     def _file_reader(cls, path, *args, **kwargs) -> str:
-        with open(path, "r+", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             return f.read()
 
     @classmethod
@@ -150,6 +337,8 @@ class SingletonStream(DataStream[str | BaseModel]):
         return value
 
     def _load(self, /, path: Optional[PathLike] = None, *, force_reload: bool = False, **kwargs) -> str | BaseModel:
+        if force_reload is False and self._data is not None:
+            return self._data  # Already loaded and parsed
         super()._load(path, force_reload=force_reload, **kwargs)
         self._data = self._apply_inner_parser(self._data)
         return self._data
@@ -163,7 +352,11 @@ class SingletonStream(DataStream[str | BaseModel]):
             if isinstance(value, str):
                 return self._inner_parser.model_validate_json(value)
             elif isinstance(value, BaseModel):
-                return self._inner_parser.model_validate(value.model_dump())
+                model = self._inner_parser if isinstance(self._inner_parser, type) else type(self._inner_parser)
+                if isinstance(value, model):
+                    return value
+                # Read the fields straight off the instance instead of round-tripping through a dict
+                return self._inner_parser.model_validate(value, from_attributes=True)
             else:
                 raise TypeError("Invalid type")
 
@@ -174,6 +367,29 @@ _HARP_READER_DEFAULT_PARAMS: Final = {
     "epoch": None,
 }  # Read-only
 
+_HARP_READ_KWARGS: Final = {
+    "keep_type": _HARP_READER_DEFAULT_PARAMS["keep_type"],
+    "epoch": _HARP_READER_DEFAULT_PARAMS["epoch"],  # internal
+}  # Read-only, bound once instead of on every load
+
+
+def _index_bin_files(root_path: PathLike) -> Dict[str, Tuple[str, ...]]:
+    """Maps every `{suffix}` for which a `*_{suffix}.bin` file exists in the directory to the matching files."""
+    index: Dict[str, List[str]] = {}
+    try:
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                if not name.endswith(".bin"):
+                    continue
+                stem = name[: -len(".bin")]
+                for i, char in enumerate(stem):
+                    if char == "_":
+                        index.setdefault(stem[i + 1 :], []).append(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return {suffix: tuple(files) for suffix, files in index.items()}
+
 
 class HarpDataStream(DataStream[DataFrameOrSeries]):
     def __init__(
@@ -184,10 +400,14 @@ class HarpDataStream(DataStream[DataFrameOrSeries]):
         name: Optional[str] = None,
         auto_load: bool = False,
         register_reader: RegisterReader = None,
+        bin_path: Optional[PathLike] = None,
         **kwargs,
     ) -> None:
         super().__init__(path, name=name, auto_load=False, **kwargs)
         self._register_reader = register_reader
+        self._bin_path = Path(bin_path) if bin_path is not None else None
+        # The root `bin_path` was resolved for
+        self._bin_path_root = Path(path) if (bin_path is not None and path is not None) else None
         self._run_auto_load(auto_load)
 
     def from_file(self, path):
@@ -205,12 +425,16 @@ class HarpDataStream(DataStream[DataFrameOrSeries]):
             pass
         else:
             path = Path(path) if path is not None else self.path
+            # A file resolved at construction only applies to the root it was resolved for, and is inferred
+            # again on reload if it has since been removed
+            bin_path = self._bin_path if path == self._bin_path_root else None
+            if bin_path is not None and force_reload and not bin_path.is_file():
+                bin_path = None
             if path:
                 self._path = path
                 self._data = self._parser(
-                    file=self._bin_file_inference_helper(path, self._register_reader, self.name),
-                    keep_type=_HARP_READER_DEFAULT_PARAMS["keep_type"],
-                    epoch=_HARP_READER_DEFAULT_PARAMS["epoch"],  # internal
+                    file=bin_path or self._bin_file_inference_helper(path, self._register_reader, self.name),
+                    **_HARP_READ_KWARGS,
                 )
             else:
                 raise ValueError("reader method is not defined")
@@ -220,12 +444,7 @@ class HarpDataStream(DataStream[DataFrameOrSeries]):
     def _bin_file_inference_helper(
         root_path: PathLike, register_reader: harp.reader.RegisterReader, name_hint: Optional[str] = None
     ) -> Path:
-        root_path = Path(root_path)
-        candidate_files = list(root_path.glob(f"*_{register_reader.register.address}.bin"))
-
-        if name_hint is not None:  # If a name hint is provided, we can try to find it
-            candidate_files += list(root_path.glob(f"*_{name_hint}.bin"))
-
+        candidate_files = HarpDataStream._bin_file_candidates(_index_bin_files(root_path), register_reader, name_hint)
         if len(candidate_files) == 1:
             return candidate_files[0]
         elif len(candidate_files) == 0:
@@ -237,10 +456,109 @@ class HarpDataStream(DataStream[DataFrameOrSeries]):
                 "Multiple binary files found for register while inferring its location. Try passing the path explicitly"
             )
 
+    @staticmethod
+    def _bin_file_candidates(
+        bin_files: Dict[str, Tuple[str, ...]],
+        register_reader: harp.reader.RegisterReader,
+        name_hint: Optional[str] = None,
+    ) -> List[Path]:
+        candidate_files = [Path(file) for file in bin_files.get(str(register_reader.register.address), ())]
+
+        if name_hint is not None:  # If a name hint is provided, we can try to find it
+            candidate_files += [Path(file) for file in bin_files.get(os.path.normcase(name_hint), ())]
+        return candidate_files
+
 
 WhoAmI = NewType("WhoAmI", int)
 
 
+def _user_cache_dir() -> Path:
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aind_behavior_core_analysis"
+
+
+_HTTP_SESSION: Final = requests.Session()  # Reuses connections across whoami.yml and device.yml requests
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _cached_get(url: str, timeout: float = 5) -> Optional[bytes]:
+    """GETs `url`, keeping an on-disk copy of the body that is revalidated with its ETag.
+
+    Returns None if the server does not have the resource (404 or 410). Falls back to the on-disk copy if the
+    request fails or the server returns any other error, and returns None if there is no copy to fall back to.
+    """
+    cache_dir = _user_cache_dir() / "http"
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_file, etag_file = cache_dir / f"{key}.bin", cache_dir / f"{key}.etag"
+
+    headers = {}
+    if body_file.is_file() and etag_file.is_file():
+        headers["If-None-Match"] = etag_file.read_text(encoding="utf-8")
+    try:
+        response = _HTTP_SESSION.get(url, headers=headers, allow_redirects=True, timeout=timeout)
+    except requests.RequestException:
+        if body_file.is_file():
+            return body_file.read_bytes()
+        raise
+
+    if response.status_code == 304:
+        try:
+            return body_file.read_bytes()
+        except OSError:  # The cached body went away since the check above, fetch it unconditionally
+            response = _HTTP_SESSION.get(url, allow_redirects=True, timeout=timeout)
+    if response.status_code in (404, 410):
+        return None
+    if response.status_code != 200:  # e.g. a 5xx, the server could not answer so the cached body is still valid
+        try:
+            return body_file.read_bytes()
+        except OSError:
+            return None
+    etag = response.headers.get("ETag", None)
+    if etag is not None:
+        try:  # The cache is best-effort, a read-only home directory should not break loading
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # The ETag is dropped first and written last, so it is never paired with a partial or stale body
+            etag_file.unlink(missing_ok=True)
+            _replace_atomically(body_file, lambda tmp: tmp.write_bytes(response.content))
+            _replace_atomically(etag_file, lambda tmp: tmp.write_text(etag, encoding="utf-8"))
+        except OSError:
+            pass
+    return response.content
+
+
+def _create_reader_cached(
+    path: Path, include_common_registers: bool, keep_type: bool, epoch: Optional[datetime.datetime]
+) -> DeviceReader:
+    """Parses the device.yml in `path` once and reuses the reader on repeated builds of the same dataset.
+
+    The reader is cached on the resolved path and the schema's modification time, so edits to device.yml are
+    picked up.
+    """
+    path = path.resolve()
+    schema = path / "device.yml" if path.is_dir() else path
+    try:
+        schema_mtime_ns = schema.stat().st_mtime_ns
+    except FileNotFoundError:
+        schema_mtime_ns = None  # Let harp report the missing schema
+    return _create_reader_for_schema(path, schema_mtime_ns, include_common_registers, keep_type, epoch)
+
+
+@lru_cache(maxsize=32)
+def _create_reader_for_schema(
+    path: Path,
+    schema_mtime_ns: Optional[int],
+    include_common_registers: bool,
+    keep_type: bool,
+    epoch: Optional[datetime.datetime],
+) -> DeviceReader:
+    return harp.create_reader(
+        device=path, include_common_registers=include_common_registers, keep_type=keep_type, epoch=epoch
+    )
+
+
 class HarpDataStreamCollectionFactory(DataStreamCollectionFactory):
     _available_inference_modes = Literal["yml", "register_0"]  # Read-only
 
@@ -249,10 +567,12 @@ class HarpDataStreamCollectionFactory(DataStreamCollectionFactory):
         path: PathLike,
         device_hint: Optional[DeviceReader | WhoAmI | PathLike] = None,
         default_inference_mode: _available_inference_modes = "yml",
+        prefetch: bool = False,
     ) -> None:
         self._path = path
         self.device_hint = device_hint
         self.default_inference_mode = default_inference_mode
+        self.prefetch = prefetch
 
     def build(self) -> DataStreamCollection:
         # Leaving this undocumented here for now...
@@ -263,7 +583,7 @@ class HarpDataStreamCollectionFactory(DataStreamCollectionFactory):
         if device_hint is None:
             match default_inference_mode:
                 case "yml":
-                    device_hint = harp.create_reader(device=path, **_HARP_READER_DEFAULT_PARAMS)
+                    device_hint = _create_reader_cached(path, **_HARP_READER_DEFAULT_PARAMS)
                 case "register_0":
                     _reg_0_hint = list(path.glob("*_0.bin")) + list(path.glob("*whoami*.bin"))
                     if len(_reg_0_hint) == 0:
@@ -271,30 +591,57 @@ class HarpDataStreamCollectionFactory(DataStreamCollectionFactory):
                     else:
                         # Not sure why we would ever have more than one file, but defaulting to using the first
                         device_hint = int(harp.read(_reg_0_hint[0]).values[0][0])
-                        return HarpDataStreamCollectionFactory(path=path, device_hint=device_hint).build()
+                        return HarpDataStreamCollectionFactory(
+                            path=path, device_hint=device_hint, prefetch=self.prefetch
+                        ).build()
                 case _:
                     raise ValueError(
                         f"Invalid default_inference_mode. Must be one of \
                             {self._available_inference_modes}"
                     )
 
-        elif isinstance(self.device_hint, DeviceReader):
+        elif isinstance(device_hint, DeviceReader):
             pass  # Trivially pass the device_reader object
-        elif isinstance(self.device_hint, Path):
-            self.device_hint = self._make_device_reader(path=path, file=self.device_hint)
-        elif isinstance(self.device_hint, int):
-            self.device_hint = self._get_reader_from_whoami(path=path, who_am_i=int(self.device_hint))
+        elif isinstance(device_hint, Path):
+            device_hint = self._make_device_reader(path=path, file=device_hint)
+        elif isinstance(device_hint, int):
+            device_hint = self._get_reader_from_whoami(path=path, who_am_i=int(device_hint))
         else:
             raise ValueError("Invalid device reader input")
 
-        if not isinstance(self.device_hint, DeviceReader):  # Guard-clause
+        if not isinstance(device_hint, DeviceReader):  # Guard-clause
             raise ValueError("Invalid device reader input")
 
+        return self._build_register_streams(path, device_hint, prefetch=self.prefetch)
+
+    @classmethod
+    def _build_register_streams(
+        cls, path: Path, device_reader: DeviceReader, prefetch: bool = False
+    ) -> DataStreamCollection:
         streams = DataStreamCollection()
-        for name, reader in self.device_hint.registers.items():
-            streams.try_append(name, HarpDataStream(path, name=name, register_reader=reader, auto_load=False))
+        bin_files = _index_bin_files(path)  # Listed once per build and shared by all registers
+        for name, reader in device_reader.registers.items():
+            # Ambiguous or missing files are left for the stream to report when it is loaded
+            candidate_files = HarpDataStream._bin_file_candidates(bin_files, reader, name)
+            bin_path = candidate_files[0] if len(candidate_files) == 1 else None
+            streams.try_append(
+                name, HarpDataStream(path, name=name, register_reader=reader, bin_path=bin_path, auto_load=False)
+            )
+        if prefetch:
+            cls._prefetch_streams(streams)
         return streams
 
+    @classmethod
+    def _prefetch_streams(cls, streams: DataStreamCollection) -> None:
+        """Loads all streams concurrently. Binary reads are I/O bound and independent across registers."""
+        if len(streams) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(streams))) as executor:
+            for stream in streams.values():
+                # Exceptions stay in the discarded futures, so streams that fail to load (e.g. a missing or
+                # ambiguous binary file) are left unloaded and report the error on their own load()
+                executor.submit(stream.load)
+
     @classmethod
     def _make_device_reader(cls, path: PathLike, file: str | PathLike | TextIO) -> DeviceReader:
         device = harp.read_schema(
@@ -332,28 +679,35 @@ class HarpDataStreamCollectionFactory(DataStreamCollectionFactory):
                 "{repository_url}/{release}/software/bonsai/device.yml",
             ]
 
-            yml = None
+            urls = []
             for hint in _repo_hint_paths:
                 url = hint.format(repository_url=repository_url, release=release)
                 if "github.com" in url:
                     url = url.replace("github.com", "raw.githubusercontent.com")
-                response = requests.get(url, allow_redirects=True, timeout=5)
-                if response.status_code == 200:
-                    yml = io.BytesIO(response.content)
-                    break
+                urls.append(url)
+
+            yml = None
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                # All candidates are requested at once, but the first hint that exists still takes precedence
+                for future in [executor.submit(_cached_get, url) for url in urls]:
+                    content = future.result()
+                    if content is not None:
+                        yml = io.BytesIO(content)
+                        break
             if yml is None:
                 raise FileNotFoundError("device.yml not found in any repository")
             else:
                 return yml
 
-    @cache
     @staticmethod
+    @cache
     def _get_who_am_i_list(
         url: str = "https://raw.githubusercontent.com/harp-tech/protocol/main/whoami.yml",
     ) -> Dict[int, Any]:
-        response = requests.get(url, allow_redirects=True, timeout=5)
-        content = response.content.decode("utf-8")
-        content = yaml.safe_load(content)
+        content = _cached_get(url)
+        if content is None:
+            raise FileNotFoundError(f"whoami.yml not found at {url}")
+        content = yaml.load(content.decode("utf-8"), Loader=_YamlSafeLoader)
         devices = content["devices"]
         return devices
 
@@ -365,6 +719,7 @@ class DataStreamCollectionFromFilePattern(DataStreamCollectionFactory):
         self._path = path
         self._stream_type = stream_type
         self._pattern = pattern
+        self._compiled_patterns = self._compile_patterns(pattern)
 
     @property
     def path(self) -> PathLike:
@@ -382,24 +737,95 @@ class DataStreamCollectionFromFilePattern(DataStreamCollectionFactory):
     def build(self) -> DataStreamCollection:
         return self._build_from_data_stream()
 
+    @classmethod
+    def _compile_patterns(cls, pattern: StrPattern) -> Tuple[Tuple[str, str, Optional[re.Pattern]], ...]:
+        """Splits each glob into (literal directory prefix, remaining pattern, compiled regex).
+
+        Single-component patterns that share a directory are merged into one regex, so each directory is
+        listed once. The regex is None when the remaining pattern spans directories and must be resolved by pathlib.
+        """
+        by_directory: Dict[str, List[str]] = {}
+        compiled: List[Tuple[str, str, Optional[re.Pattern]] | str] = []
+        for pat in normalize_pattern(pattern):
+            prefix, tail = split_glob_prefix(pat)
+            if not is_single_component(tail):
+                compiled.append((prefix, tail, None))
+            elif prefix in by_directory:
+                by_directory[prefix].append(tail)
+            else:
+                by_directory[prefix] = [tail]
+                compiled.append(prefix)  # Placeholder, keeps the directory at its first position
+        return tuple(
+            entry if isinstance(entry, tuple) else cls._merge_tails(entry, by_directory[entry]) for entry in compiled
+        )
+
     @staticmethod
-    def _get_data_streams_helper(
-        path: PathLike, stream_type: Type[DataStream], pattern: StrPattern
-    ) -> List[DataStream]:
-        _path = Path(path)
-        if isinstance(pattern, str):
-            pattern = [pattern]
-        files: List[Path] = []
-        for pat in pattern:
-            files.extend(_path.glob(pat))
-        files = list(set(files))
-        streams: List[DataStream] = [stream_type(file) for file in files]
-        return streams
+    def _merge_tails(prefix: str, tails: List[str]) -> Tuple[str, str, re.Pattern]:
+        tails = list(dict.fromkeys(tails))
+        if "*" in tails:
+            tails = ["*"]
+        return (prefix, "|".join(tails), compile_glob_patterns(tuple(tails)))
+
+    @classmethod
+    def _iter_matching_paths(
+        cls, path: PathLike, patterns: Tuple[Tuple[str, str, Optional[re.Pattern]], ...]
+    ) -> Generator[str, None, None]:
+        """Lazily yields the unique paths under `path` that match any of the patterns."""
+        root = os.path.normpath(os.fspath(path))
+        if len(patterns) > 1:
+            batches = cls._iter_prefetched_matches(root, patterns)
+        else:
+            batches = (cls._iter_pattern_matches(root, *pattern) for pattern in patterns)
+        seen: Set[str] = set()
+        for batch in batches:
+            for file in batch:
+                # scandir joins names onto the root as given while pathlib normalizes, compare a single spelling
+                file = os.path.normpath(file)
+                if file not in seen:
+                    seen.add(file)
+                    yield file
+
+    @classmethod
+    def _iter_prefetched_matches(
+        cls, root: str, patterns: Tuple[Tuple[str, str, Optional[re.Pattern]], ...]
+    ) -> Generator[List[str], None, None]:
+        """Yields the matches of each pattern while the next pattern is listed in a background thread."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(cls._list_pattern_matches, root, *patterns[0])
+            for pattern in patterns[1:]:
+                current = pending.result()
+                pending = executor.submit(cls._list_pattern_matches, root, *pattern)
+                yield current
+            yield pending.result()
+
+    @classmethod
+    def _list_pattern_matches(cls, root: str, prefix: str, tail: str, regex: Optional[re.Pattern]) -> List[str]:
+        return list(cls._iter_pattern_matches(root, prefix, tail, regex))
+
+    @staticmethod
+    def _iter_pattern_matches(
+        root: str, prefix: str, tail: str, regex: Optional[re.Pattern]
+    ) -> Generator[str, None, None]:
+        directory = os.path.join(root, prefix) if prefix else root
+        if regex is None:
+            # Recursive or nested patterns are left to pathlib
+            yield from (str(file) for file in Path(directory).glob(tail))
+            return
+        try:
+            with os.scandir(directory) as entries:
+                if tail == "*":  # Matches every entry, no need to test the names
+                    yield from (entry.path for entry in entries)
+                else:
+                    for entry in entries:
+                        if regex.match(os.path.normcase(entry.name)):
+                            yield entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            return
 
     def _build_from_data_stream(self) -> DataStreamCollection:
         streams = DataStreamCollection()
-        _this_type_stream = self._get_data_streams_helper(self.path, self.stream_type, self.pattern)
-        for stream in _this_type_stream:
+        for file in self._iter_matching_paths(self.path, self._compiled_patterns):
+            stream = self.stream_type(Path(file))
             if stream.name is None:
                 raise ValueError(f"Stream {stream} does not have a name")
             else:
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from harp.reader import DeviceReader
+
+from aind_behavior_core_analysis.io.data_stream import (
+    CsvStream,
+    DataStreamCollectionFromFilePattern,
+    HarpDataStreamCollectionFactory,
+)
+
+
+class CsvStreamTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def test_headerless_file_without_trailing_newline_keeps_all_rows(self):
+        path = self.root / "c2.csv"
+        path.write_text("1,2\n3,4", encoding="utf-8")
+        df = CsvStream(path).load()
+        self.assertEqual(len(df), 2)
+        self.assertEqual(list(df.index), [1, 3])
+
+    def test_single_numeric_column_without_header_keeps_all_rows(self):
+        path = self.root / "c1.csv"
+        path.write_text("1\n2\n3\n", encoding="utf-8")
+        df = CsvStream(path).load()
+        self.assertEqual(list(df.index), [1, 2, 3])
+
+    def test_header_is_detected(self):
+        path = self.root / "h.csv"
+        path.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+        df = CsvStream(path).load()
+        self.assertEqual(list(df.columns), ["b"])
+        self.assertEqual(len(df), 2)
+
+
+class DataStreamCollectionFromFilePatternTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for file in ["a.csv", "b.csv", "sub/c.csv"]:
+            (self.root / file).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / file).write_text("a,b\n1,2\n", encoding="utf-8")
+
+    def test_overlapping_patterns_with_unnormalized_root(self):
+        for root in [f"{self.root}//", f"{self.root}/./", self.root]:
+            with self.subTest(root=root):
+                streams = DataStreamCollectionFromFilePattern(root, CsvStream, ["*.csv", "**/*.csv"]).build()
+                self.assertEqual(sorted(streams.keys()), ["a", "b", "c"])
+
+
+class _FakeDeviceReader(DeviceReader):
+    def __init__(self, addresses):
+        self.registers = {
+            name: SimpleNamespace(register=SimpleNamespace(address=address), read=lambda **kwargs: kwargs)
+            for name, address in addresses.items()
+        }
+
+
+class HarpDataStreamCollectionFactoryTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for file in ["A_3.bin", "A_4.bin", "B_4.bin"]:
+            (self.root / file).touch()
+
+    def test_prefetch_leaves_failing_streams_unloaded(self):
+        reader = _FakeDeviceReader({"Foo": 3, "Bar": 4, "Baz": 5})
+        streams = HarpDataStreamCollectionFactory(self.root, device_hint=reader, prefetch=True).build()
+        self.assertEqual(sorted(streams.keys()), ["Bar", "Baz", "Foo"])
+        self.assertIsNotNone(streams["Foo"]._data)
+        self.assertIsNone(streams["Bar"]._data)
+        with self.assertRaises(ValueError):
+            streams["Bar"].load()
+
+
+if __name__ == "__main__":
+    unittest.main()